@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Envia uma imagem via Zé da API.
+
+A imagem pode ser uma URL pública ou uma string base64 (data URI).
+Configure HOST, INSTANCE_ID e INSTANCE_TOKEN pelas variáveis de ambiente
+ou edite os valores abaixo com os dados do seu dashboard.
+
+Uso:
+    python send_image.py
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HOST = os.getenv("ZEDAAPI_HOST", "https://sua-instancia.zedaapi.com")
+INSTANCE_ID = os.getenv("ZEDAAPI_INSTANCE_ID", "sua-instancia")
+INSTANCE_TOKEN = os.getenv("ZEDAAPI_INSTANCE_TOKEN", "seu-token-aqui")
+CLIENT_TOKEN = os.getenv("ZEDAAPI_CLIENT_TOKEN", "seu-client-token-aqui")
+
+# Sessão compartilhada: reaproveita a conexão TCP/TLS entre chamadas em vez
+# de refazer o handshake a cada requests.post. Essencial ao enviar em loop.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=100))
+_session.headers.update({"Content-Type": "application/json", "Client-Token": CLIENT_TOKEN})
+
+
+def send_image(phone: str, image: str, caption: str = "") -> dict:
+    """Envia `image` (URL ou base64) para `phone`, com legenda opcional."""
+    url = f"{HOST}/instances/{INSTANCE_ID}/token/{INSTANCE_TOKEN}/send-image"
+    payload = {"phone": phone, "image": image}
+    if caption:
+        payload["caption"] = caption
+    response = _session.post(url, json=payload, timeout=60)
+    response.raise_for_status()
+    return response.json()
+
+
+def send_image_bulk(items: list[tuple[str, str]], workers: int = 16) -> list[dict]:
+    """Envia várias (phone, image) em paralelo sobre a sessão compartilhada.
+
+    As requisições saem concorrentes pelo pool de conexões, então o tempo
+    total deixa de ser N round-trips em série. Os limites de taxa da própria
+    API limitam o paralelismo útil — aumente `workers` com moderação.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda item: send_image(*item), items))
+
+
+if __name__ == "__main__":
+    result = send_image(
+        "5511999999999",
+        "https://zedaapi.com/logo.png",
+        caption="Imagem enviada via Zé da API.",
+    )
+    print(result)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Servidor de webhook (Flask) para receber eventos do Zé da API.
+
+Aponte o webhook da sua instância para http://seu-host:8000/webhook
+(use um túnel como ngrok para testes locais).
+
+Uso:
+    python webhook_listener.py                # dev (Werkzeug)
+    WEBHOOK_PROD=1 python webhook_listener.py # produção (waitress)
+"""
+
+import logging
+import os
+
+import orjson
+from flask import Flask, request
+
+PORT = int(os.getenv("WEBHOOK_PORT", "8000"))
+
+logger = logging.getLogger(__name__)
+
+app = Flask(__name__)
+
+# respostas constantes pré-construídas: devolver 200 vira retornar um objeto
+# pronto, sem encode JSON nem alocação de dict por requisição
+_OK_RESPONSE = app.response_class(b'{"received":true}\n', mimetype="application/json")
+_HEALTH_RESPONSE = app.response_class(b'{"status":"ok"}\n', mimetype="application/json")
+
+
+def _on_messages_upsert(event):
+    message = event.get("data", {})
+    logger.info("Nova mensagem de %s", message.get("phone", "?"))
+
+
+def _on_messages_update(event):
+    logger.info("Status de mensagem atualizado")
+
+
+def _on_connection_update(event):
+    logger.info("Conexão: %s", event.get("data", {}).get("status", "?"))
+
+
+def _on_unknown(event):
+    logger.info("Evento não tratado: %s", event.get("event"))
+
+
+_HANDLERS = {
+    "messages.upsert": _on_messages_upsert,
+    "messages.update": _on_messages_update,
+    "connection.update": _on_connection_update,
+}
+
+
+@app.route("/health", methods=["GET"])
+def health():
+    return _HEALTH_RESPONSE
+
+
+@app.route("/webhook", methods=["POST"])
+def webhook():
+    # orjson decodifica direto dos bytes da requisição (parser em C),
+    # encurtando o caminho crítico antes de devolver o 200
+    try:
+        event = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        event = None
+    # corpos sintaticamente válidos mas não-objeto (null, lista, string)
+    # também são rejeitados: sem o guard, event.get() estouraria em 500 e a
+    # API reenviaria a entrega para sempre
+    if type(event) is not dict:
+        return app.response_class(
+            orjson.dumps({"received": False, "error": "JSON inválido"}),
+            mimetype="application/json",
+            status=400,
+        )
+
+    # eventos sem handler devolvem 200 na hora: fora do modo DEBUG, o caminho
+    # não tratado custa um dict.get + retorno do objeto pronto
+    handler = _HANDLERS.get(event.get("event"))
+    if handler is None and not logger.isEnabledFor(logging.DEBUG):
+        return _OK_RESPONSE
+
+    # formatação %s é preguiçosa: o payload só é serializado com DEBUG ativo;
+    # o timestamp vem do Formatter (%(asctime)s), só calculado ao emitir
+    logger.debug("payload: %s", event)
+
+    (handler or _on_unknown)(event)
+
+    # Sempre retornar 200 rapidamente: a API reenvia em caso de erro/timeout
+    return _OK_RESPONSE
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG if os.getenv("FLASK_DEBUG") == "1" else logging.INFO,
+        format="[%(asctime)s] %(levelname)s %(message)s",
+    )
+    if os.getenv("WEBHOOK_PROD") == "1":
+        # waitress atende entregas concorrentes; o dev server do Werkzeug
+        # serializa tudo em uma thread e não aguenta fan-in real
+        from waitress import serve
+
+        serve(app, host="0.0.0.0", port=PORT, threads=8)
+    else:
+        # debug/reloader só quando pedido explicitamente (custa memória e startup)
+        app.run(host="0.0.0.0", port=PORT, debug=os.getenv("FLASK_DEBUG") == "1")
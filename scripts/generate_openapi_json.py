@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Gera openapi/openapi-latest.json a partir de openapi/openapi-latest.yaml.
+
+O JSON gerado é commitado no repositório: consumidores carregam o JSON
+direto, sem parser de YAML em runtime. O hook de pre-commit usa --check
+para garantir que os dois arquivos estejam em sincronia.
+
+Uso:
+    python3 scripts/generate_openapi_json.py [--force | --check]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ROOT = Path(__file__).resolve().parents[1]
+YAML_PATH = ROOT / "openapi" / "openapi-latest.yaml"
+JSON_PATH = ROOT / "openapi" / "openapi-latest.json"
+
+# libyaml (CSafeLoader) quando disponível: ~10x mais rápido que o loader
+# puro-Python. Os wheels do PyYAML já incluem libyaml nas plataformas comuns;
+# em ambientes sem ela, caímos silenciosamente no SafeLoader.
+_LOADER = yaml.CSafeLoader if hasattr(yaml, "CSafeLoader") else yaml.SafeLoader
+
+
+def _load_yaml(path):
+    """Carrega a spec. Com libyaml, lê bytes crus: o decode UTF-8 acontece no
+    C, sem passar pela camada de texto do io (menos cópias, menor pico de RAM).
+    Buffer de 1 MiB amortiza syscalls em specs grandes."""
+    if _LOADER is not yaml.SafeLoader:
+        with open(path, "rb", buffering=1 << 20) as f:
+            return yaml.load(f, Loader=_LOADER)
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_LOADER)
+
+
+def _dump_json(spec):
+    """Serializa a spec para bytes UTF-8 (indentação de 2 espaços + newline
+    final). orjson emite UTF-8 direto em C, ~2-3x mais rápido que o stdlib;
+    sem ele, caímos no json da biblioteca padrão com a mesma formatação."""
+    if orjson is not None:
+        return orjson.dumps(spec, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(spec, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenera mesmo com o JSON mais novo que o YAML",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="só verifica se o JSON commitado está em sincronia com o YAML (não escreve)",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        data = _dump_json(_load_yaml(YAML_PATH))
+        committed = JSON_PATH.read_bytes() if JSON_PATH.exists() else b""
+        if data != committed:
+            print(
+                f"{JSON_PATH.relative_to(ROOT)} fora de sincronia com o YAML: "
+                "rode scripts/generate_openapi_json.py --force e commite o resultado",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        print(f"{JSON_PATH.relative_to(ROOT)} em sincronia com o YAML")
+        return
+
+    # caso comum (spec inalterada) vira dois stat(): nada de parse/serialize
+    if (
+        not args.force
+        and JSON_PATH.exists()
+        and JSON_PATH.stat().st_mtime >= YAML_PATH.stat().st_mtime
+    ):
+        print(f"{JSON_PATH.relative_to(ROOT)} já está atualizado (use --force para regenerar)")
+        return
+
+    spec = _load_yaml(YAML_PATH)
+
+    data = _dump_json(spec)
+    with open(JSON_PATH, "wb") as f:
+        f.write(data)
+
+    # o tamanho já é conhecido do buffer serializado: dispensa o stat()
+    print(f"Gerado {JSON_PATH.relative_to(ROOT)} ({len(data) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()